@@ -14,13 +14,19 @@ from mcp_transport_configurator import configure_mcp
 app = FastMCP()
 
 
+# Tool descriptions
+_DESC_GET_PRECISE_TIME = "Get the precise time up to microsecond precision."
+
+
 # Tool listing
-@app.tool()
-def mcp_get_precise_time():
-    """
-    MCP wrapper
-    """
-    return get_precise_time()
+# Imported functions are registered directly; the public tool name is set
+# via the name= kwarg, so no pass-through wrapper is needed
+TOOLS = [
+    ("mcp_get_precise_time", get_precise_time, _DESC_GET_PRECISE_TIME),
+]
+
+for tool_name, tool_fn, tool_desc in TOOLS:
+    app.tool(name=tool_name, description=tool_desc)(tool_fn)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,13 @@ This script updates the mcp.json file based on the protocol setting in mcp_setti
 """
 
 import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from mcp_settings import SETTINGS, PROTOCOL, STDIO, SSE, PORT
 
 def configure_mcp():
@@ -24,9 +31,8 @@ def configure_mcp():
                 }
             }
         }
-        print(f"Configured MCP for SSE transport on port {PORT}")
     else:
-        # SETTINGS[PROTOCOL] == STDIO    
+        # SETTINGS[PROTOCOL] == STDIO
         config = {
             "servers": {
                 "my-mcp-server": {
@@ -38,13 +44,25 @@ def configure_mcp():
                 }
             }
         }
-        print(f"Configured MCP for STDIO transport")
-    
-    # Write to file with nice formatting
-    with open(mcp_json_path, 'w') as f:
-        json.dump(config, f, indent=4)
-    
-    print(f"Updated {mcp_json_path} for {SETTINGS[PROTOCOL]} transport protocol")
+
+    # Serialize with nice formatting (both paths emit identical 2-space output)
+    if orjson is not None:
+        new_content = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        new_content = json.dumps(config, indent=2).encode("utf-8")
+
+    # Skip the write when the file already matches, so a server start
+    # does not touch mcp.json (and trigger editor reloads) needlessly
+    mcp_json = Path(mcp_json_path)
+    try:
+        old_content = mcp_json.read_bytes()
+    except FileNotFoundError:
+        old_content = b""
+
+    if old_content != new_content:
+        mcp_json.write_bytes(new_content)
+
+    print(f"Configured {mcp_json_path} for {SETTINGS[PROTOCOL]} transport protocol")
 
 if __name__ == "__main__":
     configure_mcp()
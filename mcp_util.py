@@ -4,10 +4,17 @@ Meant for implementing users own functions
 @author: GUU8HC
 """
 
+import time
 from datetime import datetime
 
 def get_precise_time():
     """
-    Get the precise time up to microsecond precision
+    Get the precise wall-clock time up to microsecond precision
+    Meant for logging/display; for elapsed-time measurements use
+    get_precise_elapsed_ns instead
     """
     return datetime.now()
+
+# Monotonic nanosecond counter for measuring durations;
+# much cheaper than datetime.now() and immune to clock adjustments
+get_precise_elapsed_ns = time.perf_counter_ns